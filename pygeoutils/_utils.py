@@ -3,7 +3,6 @@ from __future__ import annotations
 
 import itertools
 from dataclasses import dataclass
-from numbers import Number
 from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar, Union, cast
 
 import numpy as np
@@ -11,9 +10,9 @@ import pyproj
 import rasterio as rio
 import rasterio.transform as rio_transform
 import rioxarray._io as rxr
-import ujson as json
+import shapely
 import xarray as xr
-from shapely import LineString, Point
+from shapely import LineString, Point, Polygon, STRtree
 
 from pygeoutils.exceptions import MissingAttributeError
 
@@ -27,6 +26,18 @@ if TYPE_CHECKING:
 __all__ = ["xd_write_crs", "get_gtiff_attrs", "transform2tuple", "get_transform"]
 
 
+def _bulk_linestrings(rings: list[Any]) -> list[LineString]:
+    """Construct LineStrings for all rings in a single C call."""
+    if not rings:
+        return []
+    arrs = [np.asarray(r, dtype="f8")[:, :2] for r in rings]
+    counts = [len(a) for a in arrs]
+    lines = shapely.linestrings(
+        np.concatenate(arrs), indices=np.repeat(np.arange(len(arrs)), counts)
+    )
+    return lines.tolist()
+
+
 @dataclass
 class Convert:
     """Functions to Convert an ArcGIS JSON object to a GeoJSON object."""
@@ -36,7 +47,28 @@ class Convert:
     def features(self, arcgis: dict[str, Any], geojson: dict[str, Any]) -> dict[str, Any]:
         """Get the features from an ArcGIS JSON object."""
         geojson["type"] = "FeatureCollection"
-        geojson["features"] = [convert(f, self.id_attr) for f in arcgis["features"]]
+        geojson["features"] = [self.feature(f) for f in arcgis["features"]]
+        return geojson
+
+    def feature(self, arcgis: dict[str, Any]) -> dict[str, Any]:
+        """Convert a single ArcGIS feature to a GeoJSON feature."""
+        geojson = self.geometry(arcgis, {"type": "Feature"})
+        if arcgis.get("attributes") is not None:
+            geojson = self.attributes(arcgis, geojson)
+        else:
+            geojson["properties"] = None
+        if geojson.get("geometry") == {}:
+            geojson["geometry"] = None
+        return geojson
+
+    def geom(self, arcgis: dict[str, Any]) -> dict[str, Any]:
+        """Convert a bare ArcGIS geometry to a GeoJSON geometry."""
+        geojson: dict[str, Any] = {}
+        for k in ("xy", "points", "paths", "rings", "coords"):
+            if arcgis.get(k) is not None or k in ("xy", "coords"):
+                geojson = getattr(self, k)(arcgis, geojson)
+                if "type" in geojson:
+                    break
         return geojson
 
     @staticmethod
@@ -71,29 +103,30 @@ class Convert:
         outer_rings, holes = self.get_outer_rings(arcgis["rings"])
         uncontained_holes = self.get_uncontained_holes(outer_rings, holes)
 
+        outer_lines = _bulk_linestrings([o[0] for o in outer_rings])
         while uncontained_holes:
             # pop a hole off out stack
             hole = uncontained_holes.pop()
+            hole_line = LineString(hole)
 
             intersects = False
             x = len(outer_rings) - 1
             while x >= 0:
-                outer_ring = outer_rings[x][0]
-                l1, l2 = LineString(outer_ring), LineString(hole)
-                intersects = l1.intersects(l2)
+                intersects = outer_lines[x].intersects(hole_line)
                 if intersects:
                     outer_rings[x].append(hole)
-                    intersects = True
                     break
                 x = x - 1
 
             if not intersects:
                 outer_rings.append([hole[::-1]])
+                outer_lines.append(hole_line)
 
-        if len(outer_rings) == 1:
-            return {"type": "Polygon", "coordinates": outer_rings[0]}
+        coords = [[np.asarray(r).tolist() for r in rings] for rings in outer_rings]
+        if len(coords) == 1:
+            return {"type": "Polygon", "coordinates": coords[0]}
 
-        return {"type": "MultiPolygon", "coordinates": outer_rings}
+        return {"type": "MultiPolygon", "coordinates": coords}
 
     def coords(self, arcgis: dict[str, Any], geojson: dict[str, Any]) -> dict[str, Any]:
         """Get the bounds from an ArcGIS JSON object."""
@@ -110,8 +143,7 @@ class Convert:
             ]
         return geojson
 
-    @staticmethod
-    def geometry(arcgis: dict[str, Any], geojson: dict[str, Any]) -> dict[str, Any]:
+    def geometry(self, arcgis: dict[str, Any], geojson: dict[str, Any]) -> dict[str, Any]:
         """Get the geometry from an ArcGIS JSON object."""
         if arcgis.get("geometry") is not None:
             curves = {
@@ -125,7 +157,7 @@ class Convert:
             if not_supported:
                 geojson["geometry"] = None
             else:
-                geojson["geometry"] = convert(arcgis["geometry"])
+                geojson["geometry"] = self.geom(arcgis["geometry"])
         else:
             geojson["geometry"] = None
 
@@ -148,22 +180,21 @@ class Convert:
         outer_rings = []
         holes = []
         for ring in rings:
-            if not np.all(np.isclose(ring[0], ring[-1])):
-                ring.append(ring[0])
+            arr = np.asarray(ring, dtype="f8")
+            if arr[0, 0] != arr[-1, 0] or arr[0, 1] != arr[-1, 1]:
+                arr = np.vstack([arr, arr[:1]])
 
-            if len(ring) < 4:
+            if len(arr) < 4:
                 continue
 
-            total = sum(
-                (pt2[0] - pt1[0]) * (pt2[1] + pt1[1]) for pt1, pt2 in zip(ring[:-1], ring[1:])
-            )
+            total = np.sum((arr[1:, 0] - arr[:-1, 0]) * (arr[1:, 1] + arr[:-1, 1]))
             # Clock-wise check
             if total >= 0:
                 # wind outer rings counterclockwise for RFC 7946 compliance
-                outer_rings.append([ring[::-1]])
+                outer_rings.append([arr[::-1]])
             else:
                 # wind inner rings clockwise for RFC 7946 compliance
-                holes.append(ring[::-1])
+                holes.append(arr[::-1])
         return outer_rings, holes
 
     @staticmethod
@@ -171,58 +202,39 @@ class Convert:
         """Get all the uncontstrained holes."""
         uncontained_holes = []
 
-        while holes:
-            hole = holes.pop()
+        outer_lines = np.array(_bulk_linestrings([o[0] for o in outer_rings]))
+        tree = STRtree([Polygon(np.asarray(o[0])[:, :2]) for o in outer_rings])
+        hole_lines = _bulk_linestrings(holes)
+        for hole, hole_line in zip(holes[::-1], hole_lines[::-1]):
+            cand = tree.query(Point(hole[0]), predicate="within")
+            if cand.size > 0:
+                cand = cand[~shapely.intersects(outer_lines[cand], hole_line)]
 
-            contained = False
-            x = len(outer_rings) - 1
-            while x >= 0:
-                outer_ring = outer_rings[x][0]
-                l1, l2 = LineString(outer_ring), LineString(hole)
-                p2 = Point(hole[0])
-                intersects = l1.intersects(l2)
-                contains = l1.contains(p2)
-                if not intersects and contains:
-                    outer_rings[x].append(hole)
-                    contained = True
-                    break
-                x = x - 1
-
-            # ring is not contained in any outer ring
-            # sometimes this happens https://github.com/Esri/esri-leaflet/issues/320
-            if not contained:
+            if cand.size > 0:
+                outer_rings[int(cand.max())].append(hole)
+            else:
+                # ring is not contained in any outer ring
+                # sometimes this happens https://github.com/Esri/esri-leaflet/issues/320
                 uncontained_holes.append(hole)
         return uncontained_holes
 
     @staticmethod
     def isnumber(nums: list[Any]) -> bool:
         """Check if all items in a list are numbers."""
-        return all(isinstance(n, Number) for n in nums)
+        return all(isinstance(n, (int, float)) for n in nums)
 
 
 def convert(arcgis: dict[str, Any], id_attr: str | None = None) -> dict[str, Any]:
     """Convert an ArcGIS JSON object to a GeoJSON object."""
     togeojson = Convert(id_attr)
-    geojson: dict[str, Any] = {}
 
-    keys = ["features", "xy", "points", "paths", "rings", "coords"]
-    for k in keys:
-        if arcgis.get(k) is not None or k in ("xy", "coords"):
-            geojson = togeojson.__getattribute__(k)(arcgis, geojson)
+    if arcgis.get("features") is not None:
+        return togeojson.features(arcgis, {})
 
     if "geometry" in arcgis or "attributes" in arcgis:
-        geojson["type"] = "Feature"
-        geojson = togeojson.geometry(arcgis, geojson)
-
-        if arcgis.get("attributes") is not None:
-            geojson = togeojson.attributes(arcgis, geojson)
-        else:
-            geojson["properties"] = None
-
-    if json.dumps(geojson.get("geometry")) == json.dumps({}):
-        geojson["geometry"] = None
+        return togeojson.feature(arcgis)
 
-    return geojson
+    return togeojson.geom(arcgis)
 
 
 class Attrs(NamedTuple):
@@ -272,6 +284,7 @@ def get_bounds(
     ds_dims : tuple, optional
         Names of the coordinames in the dataset, defaults to ``("y", "x")``.
         The order of the dimension names must be (vertical, horizontal).
+        The coordinates are assumed to be monotonic.
 
     Returns
     -------
@@ -279,8 +292,10 @@ def get_bounds(
         The bounds in the order of (left, bottom, right, top)
     """
     ydim, xdim = ds_dims
-    left, right = ds[xdim].min().item(), ds[xdim].max().item()
-    bottom, top = ds[ydim].min().item(), ds[ydim].max().item()
+    xvals = ds[xdim].to_numpy()
+    yvals = ds[ydim].to_numpy()
+    left, right = sorted((float(xvals[0]), float(xvals[-1])))
+    bottom, top = sorted((float(yvals[0]), float(yvals[-1])))
     return left, bottom, right, top
 
 
@@ -6,6 +6,7 @@ import contextlib
 import warnings
 from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Sequence, Tuple, TypeVar, Union, cast
 
 import cytoolz.curried as tlz
@@ -139,6 +140,33 @@ class Coordinates:
         return self._points
 
 
+@lru_cache(maxsize=64)
+def _same_crs(in_crs: CRSTYPE, out_crs: CRSTYPE) -> bool:
+    """Check if two CRS are identical."""
+    return pyproj.CRS(in_crs) == pyproj.CRS(out_crs)
+
+
+@lru_cache(maxsize=64)
+def _get_transformer(in_crs: CRSTYPE, out_crs: CRSTYPE) -> pyproj.Transformer:
+    """Get a transformer object for reprojection between two CRS."""
+    return pyproj.Transformer.from_crs(in_crs, out_crs, always_xy=True)
+
+
+def _reproject(geom: GEOM, in_crs: CRSTYPE, out_crs: CRSTYPE) -> GEOM:
+    """Transform all coordinates of a geometry in one batched PROJ call."""
+    transformer = _get_transformer(in_crs, out_crs)
+    include_z = bool(shapely.has_z(geom))
+
+    def project(coords: FloatArray) -> FloatArray:
+        if include_z:
+            xs, ys, zs = transformer.transform(coords[:, 0], coords[:, 1], coords[:, 2])
+            return np.column_stack([xs, ys, zs])
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        return np.column_stack([xs, ys])
+
+    return shapely.transform(geom, project, include_z=include_z)
+
+
 def geometry_reproject(geom: GEOM, in_crs: CRSTYPE, out_crs: CRSTYPE) -> GEOM:
     """Reproject a geometry to another CRS.
 
@@ -171,8 +199,6 @@ def geometry_reproject(geom: GEOM, in_crs: CRSTYPE, out_crs: CRSTYPE) -> GEOM:
     >>> geometry_reproject(coords, 3857, 4326)
     [(-69.7636111130079, 45.44549114818127)]
     """
-    project = pyproj.Transformer.from_crs(in_crs, out_crs, always_xy=True).transform
-
     if isinstance(
         geom,
         (
@@ -184,31 +210,31 @@ def geometry_reproject(geom: GEOM, in_crs: CRSTYPE, out_crs: CRSTYPE) -> GEOM:
             MultiPoint,
         ),
     ):
-        if pyproj.CRS(in_crs) == pyproj.CRS(out_crs):
+        if _same_crs(in_crs, out_crs):
             return geom
-        return ops.transform(project, geom)
+        return _reproject(geom, in_crs, out_crs)
 
     with contextlib.suppress(TypeError, AttributeError, ValueError):
         if len(geom) > 4:
             raise TypeError
-        if pyproj.CRS(in_crs) == pyproj.CRS(out_crs):
+        if _same_crs(in_crs, out_crs):
             bbox = shapely.box(*geom)
         else:
-            bbox = cast("Polygon", ops.transform(project, shapely.box(*geom)))
+            bbox = _reproject(shapely.box(*geom), in_crs, out_crs)
         return tuple(float(p) for p in bbox.bounds)
 
     with contextlib.suppress(TypeError, AttributeError, ValueError):
-        if pyproj.CRS(in_crs) == pyproj.CRS(out_crs):
+        if _same_crs(in_crs, out_crs):
             point = Point(geom)
         else:
-            point = cast("Point", ops.transform(project, Point(geom)))
+            point = _reproject(Point(geom), in_crs, out_crs)
         return [(float(point.x), float(point.y))]
 
     with contextlib.suppress(TypeError, AttributeError, ValueError):
-        if pyproj.CRS(in_crs) == pyproj.CRS(out_crs):
+        if _same_crs(in_crs, out_crs):
             mp = MultiPoint(geom)
         else:
-            mp = cast("MultiPoint", ops.transform(project, MultiPoint(geom)))
+            mp = _reproject(MultiPoint(geom), in_crs, out_crs)
         return [(float(p.x), float(p.y)) for p in mp.geoms]
 
     gtypes = " ".join(
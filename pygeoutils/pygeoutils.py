@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import contextlib
+import io
+import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Tuple, TypeVar, Union, cast, overload
 
@@ -14,6 +17,7 @@ import pyproj
 import rasterio.features as rio_features
 import rasterio.transform as rio_transform
 import rioxarray._io as rxr
+import shapely
 import shapely.geometry as sgeom
 import ujson as json
 import xarray as xr
@@ -29,10 +33,17 @@ from pygeoutils.exceptions import (
     EmptyResponseError,
     InputTypeError,
     InputValueError,
+    MissingAttributeError,
     MissingCRSError,
 )
 
+try:
+    import pyogrio
+except ImportError:
+    pyogrio = None
+
 BOX_ORD = "(west, south, east, north)"
+PYOGRIO_NFEAT = 5000
 NUMBER = Union[int, float, np.number]  # pyright: ignore[reportMissingTypeArgument]
 if TYPE_CHECKING:
     GTYPE = Union[Polygon, MultiPolygon, Tuple[float, float, float, float]]
@@ -51,7 +62,9 @@ __all__ = [
 ]
 
 
-def arcgis2geojson(arcgis: str | dict[str, Any], id_attr: str | None = None) -> dict[str, Any]:
+def arcgis2geojson(
+    arcgis: str | bytes | dict[str, Any], id_attr: str | None = None
+) -> dict[str, Any]:
     """Convert ESRIGeoJSON format to GeoJSON.
 
     Notes
@@ -70,12 +83,38 @@ def arcgis2geojson(arcgis: str | dict[str, Any], id_attr: str | None = None) ->
     dict
         A GeoJSON file readable by GeoPandas.
     """
-    if isinstance(arcgis, str):
+    if isinstance(arcgis, (str, bytes)):
         return utils.convert(json.loads(arcgis), id_attr)
 
     return utils.convert(arcgis, id_attr)
 
 
+def _from_features(collection: dict[str, Any] | list[dict[str, Any]]) -> gpd.GeoDataFrame:
+    """Create a GeoDataFrame from a GeoJSON feature collection."""
+    feats = collection.get("features") if isinstance(collection, dict) else collection
+    if feats is None:
+        raise InputTypeError("content", "a (Geo)JSON feature collection")
+
+    # Fail fast on ESRI features so the caller converts them before any serialization.
+    geom0 = next((f.get("geometry") for f in feats if f.get("geometry") is not None), None)
+    if (geom0 is not None and "type" not in geom0) or (feats and "attributes" in feats[0]):
+        raise InputTypeError("content", "a (Geo)JSON feature collection")
+
+    if pyogrio is not None and len(feats) > PYOGRIO_NFEAT:
+        buf = json.dumps({"type": "FeatureCollection", "features": feats}).encode()
+        with contextlib.suppress(pyogrio.errors.DataSourceError):
+            return pyogrio.read_dataframe(io.BytesIO(buf))
+
+    geometry = np.full(len(feats), None, dtype=object)
+    valid = [i for i, f in enumerate(feats) if f.get("geometry") is not None]
+    if valid:
+        geometry[valid] = shapely.from_geojson(
+            np.array([json.dumps(feats[i]["geometry"]) for i in valid])
+        )
+    props = pd.DataFrame(f.get("properties") or {} for f in feats)
+    return gpd.GeoDataFrame(props, geometry=geometry)
+
+
 def json2geodf(
     content: list[dict[str, Any]] | dict[str, Any],
     in_crs: CRSTYPE = 4326,
@@ -102,20 +141,19 @@ def json2geodf(
 
     content = content if isinstance(content, list) else [content]
     try:
-        geodf = gpd.GeoDataFrame.from_features(next(iter(content)))
-    except TypeError:
+        geodf = _from_features(next(iter(content)))
+    except (TypeError, shapely.GEOSException):
         content = [arcgis2geojson(c) for c in content]
-        geodf = gpd.GeoDataFrame.from_features(content[0])
+        geodf = _from_features(content[0])
     except StopIteration as ex:
         raise EmptyResponseError from ex
 
     if len(content) > 1:
-        geodf = gpd.GeoDataFrame(
-            pd.concat((gpd.GeoDataFrame.from_features(c) for c in content), ignore_index=True)
-        )
+        frames = [geodf, *(_from_features(c) for c in content[1:])]
+        geodf = gpd.GeoDataFrame(pd.concat(frames, ignore_index=True))
 
     if "geometry" in geodf and not geodf.geometry.is_empty.all():
-        geodf = geodf.set_crs(in_crs)
+        geodf = geodf.set_crs(in_crs, allow_override=True)
         if in_crs != crs:
             geodf = geodf.to_crs(crs)
     geodf = cast("gpd.GeoDataFrame", geodf)
@@ -167,8 +205,9 @@ def xarray_geomask(
     geom = geotools.geo2polygon(geometry, crs, ds.rio.crs)
     ds = utils.xd_write_crs(ds)
     try:
-        ds = ds.rio.clip_box(*geom.bounds, auto_expand=True)
-        if isinstance(geometry, (Polygon, MultiPolygon)):
+        if drop:
+            ds = ds.rio.clip_box(*geom.bounds, auto_expand=True)
+        if isinstance(geometry, (Polygon, MultiPolygon)) or not drop:
             ds = ds.rio.clip([geom], all_touched=all_touched, drop=drop, from_disk=from_disk)
     except OneDimensionalRaster:
         ds = ds.rio.clip([geom], all_touched=True, drop=drop, from_disk=from_disk)
@@ -264,32 +303,48 @@ def gtiff2xarray(
     if "_dd_" in key1:
         var_name = {lyr: "_".join(lyr.split("_")[:-3]) for lyr in r_dict}
 
-    attrs = utils.get_gtiff_attrs(r_dict[key1], ds_dims, driver, nodata)
     dtypes: dict[str, type] = {}
     nodata_dict: dict[str, NUMBER] = {}
 
-    ds = xr.merge(
-        _to_dataset(resp, var_name[lyr], driver, dtypes, nodata_dict, nodata)
-        for lyr, resp in r_dict.items()
-    )
+    if len(r_dict) > 1:
+        # Layers are independent and rasterio releases the GIL, so decode in parallel.
+        with ThreadPoolExecutor(max_workers=min(len(r_dict), os.cpu_count() or 1)) as executor:
+            ds_list = list(
+                executor.map(
+                    lambda kv: _to_dataset(
+                        kv[1], var_name[kv[0]], driver, dtypes, nodata_dict, nodata
+                    ),
+                    r_dict.items(),
+                )
+            )
+    else:
+        ds_list = [_to_dataset(r_dict[key1], var_name[key1], driver, dtypes, nodata_dict, nodata)]
+    ds = xr.merge(ds_list)
 
     with contextlib.suppress(ValueError, KeyError):
         ds = ds.squeeze("band", drop=True)
 
+    if ds_dims is None:
+        ds_dims = utils.get_dim_names(ds)
+    valid_dims = cast("list[str]", list(ds.sizes))
+    if ds_dims is None or any(d not in valid_dims for d in ds_dims):
+        raise MissingAttributeError("ds_dims", valid_dims)
+
+    crs_str = pyproj.CRS(ds.rio.crs).to_string()
     variables = cast("str", list(ds))
     if len(variables) == 1:
         ds = ds[variables[0]].copy()
         ds = ds.astype(dtypes[variables[0]])
         name = cast("str", ds.name)
-        ds.attrs["crs"] = attrs.crs.to_string()
+        ds.attrs["crs"] = crs_str
         ds.attrs["nodatavals"] = (nodata_dict[name],)
         ds = ds.rio.write_nodata(nodata_dict[name])
         ds = cast("xr.DataArray", ds)
     else:
-        ds.attrs["crs"] = attrs.crs.to_string()
+        ds.attrs["crs"] = crs_str
         for v in variables:
             ds[v] = ds[v].astype(dtypes[v])
-            ds[v].attrs["crs"] = attrs.crs.to_string()
+            ds[v].attrs["crs"] = crs_str
             ds[v].attrs["nodatavals"] = (nodata_dict[v],)
             ds[v] = ds[v].rio.write_nodata(nodata_dict[v])
 
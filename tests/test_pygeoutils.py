@@ -44,6 +44,14 @@ def test_geom_list():
     assert len(glist) == 2
 
 
+def test_reproject_z():
+    line = LineString([[-69.77, 45.07, 10.0], [-69.31, 45.45, 20.0]])
+    proj = geoutils.geometry_reproject(line, DEF_CRS, 3857)
+    assert proj.has_z
+    back = geoutils.geometry_reproject(proj, 3857, DEF_CRS)
+    assert_close(np.asarray(back.coords), np.asarray(line.coords))
+
+
 def test_break_line():
     crs_proj = 3857
     lines = gpd.GeoSeries([LineString([[0, 0], [2, 2]])], crs=crs_proj)
@@ -140,6 +148,13 @@ def test_json2geodf():
     assert_close(flw["lengthkm"].sum(), 8.917 * 2)
 
 
+def test_json2geodf_attrs_only():
+    resp = {"features": [{"attributes": {"OBJECTID": 5141, "v": 1}}]}
+    df = geoutils.json2geodf(resp)
+    assert set(df.columns) == {"OBJECTID", "v", "geometry"}
+    assert df.geometry.isna().all()
+
+
 def test_gtiff2array(wms_resp):
     canopy_box = geoutils.gtiff2xarray(wms_resp, GEO_NAT.bounds, DEF_CRS)
     canopy = geoutils.gtiff2xarray(wms_resp, GEO_NAT, DEF_CRS, drop=False)
@@ -334,6 +349,25 @@ def test_ring():
     assert _ring == res
 
 
+def test_ring_with_hole():
+    ring = {
+        "rings": [
+            [[0, 0], [0, 10], [10, 10], [10, 0], [0, 0]],
+            [[2, 2], [8, 2], [8, 8], [2, 8], [2, 2]],
+        ],
+        "spatialReference": {"wkid": 4326},
+    }
+    _ring = geoutils.arcgis2geojson(ring)
+    res = {
+        "type": "Polygon",
+        "coordinates": [
+            [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0], [0.0, 10.0], [0.0, 0.0]],
+            [[2.0, 2.0], [2.0, 8.0], [8.0, 8.0], [8.0, 2.0], [2.0, 2.0]],
+        ],
+    }
+    assert _ring == res
+
+
 def test_point():
     point = {"x": -118.15, "y": 33.80, "z": 10.0, "spatialReference": {"wkid": 4326}}
     _point = geoutils.arcgis2geojson(point)